@@ -10,10 +10,11 @@ from .sequence import AbstractSequenceGenerator
 from .throttle import AbstractThrottleHandler
 from .state import (OptionalTag, OptionalParam, SmppCommand, SmppCommandStatus, SmppDataCoding,
                     SmppSessionState, BindMode, TON, NPI, PhoneNumber, SmppError)
-from .protocol import (SubmitSm, SubmitSmResp, DeliverSm, DeliverSmResp, Unbind, UnbindResp,
-                       BindTransceiver, BindTransceiverResp, BindReceiver, BindReceiverResp,
-                       BindTransmitter, BindTransmitterResp, EnquireLink, EnquireLinkResp,
-                       GenericNack, SmppMessage, Trackable, PduHeader, SMPP_VERSION_3_4)
+from .protocol import (SubmitSm, SubmitSmBatch, SubmitSmResp, DeliverSm, DeliverSmResp, Unbind,
+                       UnbindResp, BindTransceiver, BindTransceiverResp, BindReceiver,
+                       BindReceiverResp, BindTransmitter, BindTransmitterResp, EnquireLink,
+                       EnquireLinkResp, GenericNack, SmppMessage, Trackable, PduHeader,
+                       SMPP_VERSION_3_4)
 from .jsonutils import json_decode, json_encode
 
 __all__ = [
@@ -21,9 +22,10 @@ __all__ = [
     'ESME', 'AbstractBroker', 'AbstractCorrelator', 'AbstractHook', 'AbstractRateLimiter',
     'AbstractRetryTimer', 'AbstractSequenceGenerator', 'AbstractThrottleHandler', 'OptionalTag',
     'OptionalParam', 'SmppCommand', 'SmppCommandStatus', 'SmppDataCoding', 'SmppSessionState',
-    'BindMode', 'TON', 'NPI', 'PhoneNumber', 'SmppError', 'SubmitSm', 'SubmitSmResp', 'DeliverSm',
-    'DeliverSmResp', 'Unbind', 'UnbindResp', 'BindTransceiver', 'BindTransceiverResp',
-    'BindReceiver', 'BindReceiverResp', 'BindTransmitter', 'BindTransmitterResp',
+    'BindMode', 'TON', 'NPI', 'PhoneNumber', 'SmppError', 'SubmitSm', 'SubmitSmBatch',
+    'SubmitSmResp', 'DeliverSm', 'DeliverSmResp', 'Unbind', 'UnbindResp', 'BindTransceiver',
+    'BindTransceiverResp', 'BindReceiver', 'BindReceiverResp', 'BindTransmitter',
+    'BindTransmitterResp',
     'EnquireLink', 'EnquireLinkResp' , 'GenericNack', 'SmppMessage', 'Trackable', 'PduHeader',
     'json_decode', 'json_encode'
 ]
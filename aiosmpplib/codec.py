@@ -1,6 +1,5 @@
 from codecs import (Codec, CodecInfo, lookup, utf_16_be_decode, utf_16_be_encode)
 from abc import abstractmethod
-from struct import pack
 from typing import Dict, List, Optional, Tuple
 
 # GSM 03.38 -> unicode
@@ -222,7 +221,7 @@ class GSM7BitCodec(SmsCodec):
             raise ValueError(f'Unknown error handling {errors}.')
 
         gsm_codes: List[int] = self.to_gsm_codes(input, errors)
-        return pack('!' + 'B' * len(gsm_codes), *gsm_codes), len(input)
+        return bytes(gsm_codes), len(input)
 
 
     def decode(self, input: bytes, errors: str='strict') -> Tuple[str, int]:
@@ -402,6 +401,12 @@ INBUILT_CODECS: Dict[str, CodecInfo] = {
     UCS2Codec.get_name(): UCS2Codec.get_codec_info(),
 }
 
+# Codecs found in Python registry are cached here together with inbuilt ones,
+# because `lookup` normalizes encoding name on every call. Only a handful
+# of encodings are ever used, so the cache stays small.
+_CODEC_CACHE: Dict[str, CodecInfo] = dict(INBUILT_CODECS)
+
+
 # We don't register codecs with Python registry to avoid conflict with other libraries
 # which may register the same codecs. Instead, we provide our own encode and decode methods.
 # We also get the ability to have per-client custom codecs.
@@ -409,8 +414,10 @@ def find_codec_info(encoding: str, custom_codecs: Optional[Dict[str, CodecInfo]]
     codec_info: Optional[CodecInfo] = None
     if custom_codecs:
         codec_info = custom_codecs.get(encoding)
-    if not codec_info:
-        codec_info = INBUILT_CODECS.get(encoding)
+        if codec_info:
+            return codec_info
+    codec_info = _CODEC_CACHE.get(encoding)
     if not codec_info:
         codec_info = lookup(encoding) # Will raise LookupError if not found
+        _CODEC_CACHE[encoding] = codec_info
     return codec_info
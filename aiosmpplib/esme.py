@@ -4,14 +4,16 @@ import asyncio
 from asyncio import StreamReader, StreamWriter, Task, CancelledError, IncompleteReadError
 from codecs import CodecInfo
 from string import ascii_lowercase, digits
-from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple, Type, TypeVar, Union
+from typing import (Any, Awaitable, Callable, Dict, FrozenSet, Optional, Set, Tuple, Type, TypeVar,
+                    Union)
 from .broker import AbstractBroker, SimpleBroker
 from .correlator import AbstractCorrelator, SimpleCorrelator
 from .hook import AbstractHook, SimpleHook
 from .log import ERROR, WARNING, INFO, StructuredLogger, Handler
-from .protocol import (DEFAULT_ENCODING, MESSAGE_TYPE_MAP, PDU_HEADER_LENGTH, SMPP_VERSION_3_4,
-                       SmppMessage, GenericNack, SubmitSm, SubmitSmResp, DeliverSm,
-                       BindReceiver, BindTransmitter, BindTransceiver, EnquireLink, Unbind)
+from .protocol import (DEFAULT_ENCODING, FROM_PDU_MAP, MESSAGE_TYPE_MAP, PDU_HEADER_LENGTH,
+                       SMPP_VERSION_3_4, SmppMessage, GenericNack, SubmitSm, SubmitSmResp,
+                       DeliverSm, BindReceiver, BindTransmitter, BindTransceiver, EnquireLink,
+                       Unbind)
 from .ratelimiter import AbstractRateLimiter
 from .retrytimer import AbstractRetryTimer, SimpleExponentialBackoff
 from .sequence import AbstractSequenceGenerator, SimpleSequenceGenerator, assert_valid_sequence
@@ -26,6 +28,20 @@ T = TypeVar('T') # For generic type hints
 # The message_payload parameter can hold up to 64k data, and we add a little more to that
 # to guard against an unlikely possibility of LimitOverrunError.
 _NETWORK_BUFFER_LIMIT = 2 ** 16 + 1024
+# Responses to requests that ESME sends
+_HANDLED_RESPONSES: FrozenSet[SmppCommand] = frozenset((
+    SmppCommand.BIND_TRANSMITTER_RESP, SmppCommand.BIND_RECEIVER_RESP,
+    SmppCommand.BIND_TRANSCEIVER_RESP, SmppCommand.UNBIND_RESP, SmppCommand.SUBMIT_SM_RESP,
+    SmppCommand.ENQUIRE_LINK_RESP, SmppCommand.GENERIC_NACK,
+))
+# Requests from SMSC that ESME can handle
+_HANDLED_REQUESTS: FrozenSet[SmppCommand] = frozenset((
+    SmppCommand.UNBIND, SmppCommand.ENQUIRE_LINK, SmppCommand.DELIVER_SM,
+))
+# Response statuses which indicate that SMSC is throttling requests
+_THROTTLED_STATUSES: FrozenSet[SmppCommandStatus] = frozenset((
+    SmppCommandStatus.ESME_RTHROTTLED, SmppCommandStatus.ESME_RMSGQFUL,
+))
 
 
 class ESME:
@@ -76,7 +92,8 @@ class ESME:
                  socket_timeout: float=30.0,
                  custom_codecs: Optional[Dict[str, CodecInfo]]=None,
                  default_encoding: str=DEFAULT_ENCODING,
-                 testing: bool=False) -> None:
+                 testing: bool=False,
+                 parse_receipt_text: bool=True) -> None:
         '''
         Parameters:
             smsc_host: The IP address(or domain name) of the SMSC gateway/server
@@ -119,6 +136,9 @@ class ESME:
             default_encoding: SMSC default alphabet (SMPP 3.4 specification does not
                               enforce default alphabet, so it may be anything)
             testing: Set to True when doing unit tests
+            parse_receipt_text: Set to False to take message ID of delivery receipts from
+                                receipted_message_id optional parameter when it is present,
+                                without parsing receipt text.
 
         Raises:
             ValueError: raised if there's an error instantiating a ESME.
@@ -150,6 +170,7 @@ class ESME:
         check_param(custom_codecs, 'custom_codecs', dict, optional=True)
         check_param(default_encoding, 'default_encoding', str)
         check_param(testing, 'testing', bool)
+        check_param(parse_receipt_text, 'parse_receipt_text', bool)
         if default_encoding not in SmppDataCoding.__members__:
             raise ValueError(f'Unrecognised default SMPP encoding: `{default_encoding}`.')
         if custom_codecs:
@@ -177,6 +198,7 @@ class ESME:
         self.default_encoding: str = default_encoding
         self.custom_codecs: Optional[Dict[str, CodecInfo]] = custom_codecs
         self.testing: bool = testing
+        self.parse_receipt_text: bool = parse_receipt_text
         if log_metadata is None:
             log_metadata = {
                 'smsc_host': smsc_host,
@@ -410,7 +432,7 @@ class ESME:
 
                     if self.testing:
                         # Offer escape hatch for tests to come out of endless loop
-                        return smpp_message.__dict__
+                        return smpp_message.as_dict()
                 else:
                     # Throttle_handler didn't allow us to send request.
                     delay: float = await self.throttle_handler.throttle_delay()
@@ -478,11 +500,7 @@ class ESME:
         '''
         self._logger.debug('Handling SMPP response', header=header)
 
-        if header.smpp_command not in (SmppCommand.BIND_TRANSMITTER_RESP,
-                                       SmppCommand.BIND_RECEIVER_RESP,
-                                       SmppCommand.BIND_TRANSCEIVER_RESP,
-                                       SmppCommand.UNBIND_RESP, SmppCommand.SUBMIT_SM_RESP,
-                                       SmppCommand.ENQUIRE_LINK_RESP, SmppCommand.GENERIC_NACK):
+        if header.smpp_command not in _HANDLED_RESPONSES:
             # This should not happen; we don't send any other requests
             self._logger.warning('Received unexpected SMPP response', header=header)
             return None
@@ -498,12 +516,12 @@ class ESME:
             # This should DEFINITELY not happen
             if self._logger.isEnabledFor(ERROR):
                 self._logger.error('SMPP response correlated to unrelated request',
-                                   header=header, request=original_message.__dict__)
+                                   header=header, request=original_message.as_dict())
             return None
 
-        message_class: Type[SmppMessage] = MESSAGE_TYPE_MAP[header.smpp_command]
+        from_pdu: Callable[..., SmppMessage] = FROM_PDU_MAP[header.smpp_command]
         try:
-            smpp_message: SmppMessage = message_class.from_pdu(pdu, header)
+            smpp_message: SmppMessage = from_pdu(pdu, header)
         except ValueError:
             if self._logger.isEnabledFor(ERROR):
                 self._logger.exception('Unable to parse PDU', header=header, pdu=pdu.hex())
@@ -512,8 +530,7 @@ class ESME:
 
         if isinstance(smpp_message, SubmitSmResp) and isinstance(original_message, SubmitSm):
             # Call throttling handler
-            if header.command_status in (SmppCommandStatus.ESME_RTHROTTLED,
-                                         SmppCommandStatus.ESME_RMSGQFUL):
+            if header.command_status in _THROTTLED_STATUSES:
                 await self.throttle_handler.throttled()
             else:
                 await self.throttle_handler.not_throttled()
@@ -553,24 +570,23 @@ class ESME:
         '''
         self._logger.debug('Handling SMPP request', header=header)
 
-        if header.smpp_command not in (SmppCommand.UNBIND, SmppCommand.ENQUIRE_LINK,
-                                       SmppCommand.DELIVER_SM):
+        if header.smpp_command not in _HANDLED_REQUESTS:
             # This should not happen; we can't handle any other requests
             self._logger.warning('Received unexpected SMPP request', header=header)
             await self._send_data(GenericNack(header.sequence_num))
             return None
 
-        message_class: Type[SmppMessage] = MESSAGE_TYPE_MAP[header.smpp_command]
+        from_pdu: Callable[..., SmppMessage] = FROM_PDU_MAP[header.smpp_command]
         try:
-            smpp_message: SmppMessage = message_class.from_pdu(pdu, header, self.default_encoding,
-                                                               self.custom_codecs)
+            smpp_message: SmppMessage = from_pdu(pdu, header, self.default_encoding,
+                                                 self.custom_codecs)
         except ValueError:
             if self._logger.isEnabledFor(ERROR):
                 self._logger.exception('Unable to parse PDU', header=header, pdu=pdu.hex())
             await self._send_data(GenericNack(header.sequence_num))
             return None
         if isinstance(smpp_message, DeliverSm) and smpp_message.is_receipt():
-            receipt: Dict[str, Any] = smpp_message.parse_receipt()
+            receipt: Dict[str, Any] = smpp_message.parse_receipt(self.parse_receipt_text)
             msg_id: str = receipt.get('id', '')
             if msg_id:
                 log_id: str
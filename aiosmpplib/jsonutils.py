@@ -23,10 +23,11 @@ def _json_default(o: Any) -> Any:
         return o.isoformat()
     if isinstance(o, SmppMessage):
         result: Dict[str, Any] = {'__smpp_command__': o.smpp_command.name}
-        result.update(o.__dict__)
+        result.update(o.as_dict())
         return result
     if dataclasses.is_dataclass(o):
-        return o.__dict__
+        # Slotted dataclasses don't have __dict__
+        return {field.name: getattr(o, field.name) for field in dataclasses.fields(o)}
     raise TypeError(f'Object of type {o.__class__.__name__} '
                     f'is not JSON serializable')
 
@@ -1,29 +1,161 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from array import array
 from codecs import CodecInfo
-from dataclasses import dataclass
+from dataclasses import MISSING, dataclass, fields
 from datetime import datetime, timedelta
-from math import floor
-from struct import pack, unpack_from
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from enum import IntEnum
+from functools import lru_cache
+from struct import Struct
+from typing import (Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple,
+                    Type, Union, cast)
 
 from .codec import find_codec_info
+from .sequence import MAX_SEQUENCE_NUMBER
 from .state import (NPI, TON, OptionalParam, OptionalTag, PhoneNumber, SmppCommand,
                     SmppCommandStatus, SmppDataCoding, PduHeader)
-from .utils import check_param, FixedOffset
+from .utils import add_slots, check_param, FixedOffset
 
 
 NULL = b'\x00'
 PDU_HEADER_LENGTH: int = 16
 SMPP_VERSION_3_4: int = 0x34
 DEFAULT_ENCODING: str = 'gsm0338'
+# Precompiled formats, so format strings are not parsed on every PDU
+_HEADER: Struct = Struct('!IIII') # PDU length, command ID, status, sequence number
+_BB: Struct = Struct('!BB')
+_BBB: Struct = Struct('!BBB')
+_HH: Struct = Struct('!HH')
+# Fixed-size part of submit_sm/deliver_sm body: five NULL terminators and twelve
+# single-byte fields (TON/NPI pairs, esm_class ... sm_length)
+_SM_FIXED_BODY_LENGTH: int = 17
+_MESSAGE_PAYLOAD_TAG: int = OptionalTag.MESSAGE_PAYLOAD.value
+# Default encodings with a known highest encodable character. smpp_encode uses them to detect
+# text which needs UCS2 without attempting the default encoding first.
+_ASCII_BASED_ENCODINGS: Dict[str, str] = {'ascii': '\x7f', 'latin_1': '\xff'}
+
+
+class _MemberMap(dict):
+    '''
+    Maps values of an enum to its members. Lookup is faster than calling the enum class.
+    Unknown values are passed to the enum class, which raises ValueError as usual.
+    '''
+    __slots__ = ('enum_class',)
+
+    def __init__(self, enum_class: Type[IntEnum]) -> None:
+        super().__init__((member.value, member) for member in enum_class)
+        self.enum_class: Type[IntEnum] = enum_class
+
+    def __missing__(self, value: int) -> IntEnum:
+        return self.enum_class(value)
+
+
+# Direct value to member maps, used instead of calling enum classes for every PDU
+_COMMANDS: Dict[int, SmppCommand] = _MemberMap(SmppCommand)
+_COMMAND_STATUSES: Dict[int, SmppCommandStatus] = _MemberMap(SmppCommandStatus)
+_TONS: Dict[int, TON] = _MemberMap(TON)
+_NPIS: Dict[int, NPI] = _MemberMap(NPI)
+_OPTIONAL_TAGS: Dict[int, OptionalTag] = _MemberMap(OptionalTag)
+
+# Per-class default field values and their names, used when creating messages
+# from trusted PDU data
+_TRUSTED_DEFAULTS: Dict[type, Tuple[Dict[str, Any], FrozenSet[str]]] = {}
+
+
+def _receipt_date_to_str(date: datetime) -> str:
+    '''
+    Formats delivery receipt date as YYMMDDhhmm, without going through strftime.
+    '''
+    return '%02d%02d%02d%02d%02d' % (date.year % 100, date.month, date.day,
+                                     date.hour, date.minute)
+
+
+@lru_cache(maxsize=4096)
+def _parse_receipt_date(date_str: str) -> datetime:
+    '''
+    Parses delivery receipt date in YYMMDDhhmm format.
+    Receipts often carry identical minute-resolution dates, so results are cached.
+    '''
+    if len(date_str) == 10 and date_str.isdigit():
+        year: int = int(date_str[0:2])
+        try:
+            # Two-digit years are mapped the same way as strptime does
+            return datetime(year + (2000 if year < 69 else 1900), int(date_str[2:4]),
+                            int(date_str[4:6]), int(date_str[6:8]), int(date_str[8:10]))
+        except ValueError:
+            pass
+    # Anything else is handled (and rejected) by strptime, which accepts some unusual forms
+    return datetime.strptime(date_str, '%y%m%d%H%M')
+
+
+# Conversion of receipt param values from text
+_RECEIPT_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    'sub': int,
+    'dlvrd': int,
+    'submit date': _parse_receipt_date,
+    'done date': _parse_receipt_date,
+}
+
+
+def _pack_segments(buf: bytearray, offset: int, segments: Sequence[bytes]) -> int:
+    '''
+    Writes encoded PDU parts (e.g. optional parameters) directly into PDU buffer,
+    without joining them first. Returns offset past the last written segment.
+    '''
+    segment: bytes
+    for segment in segments:
+        end: int = offset + len(segment)
+        buf[offset:end] = segment
+        offset = end
+    return offset
+
+
+class _PduReader:
+    '''
+    Sequential reader of PDU body fields. Integers are big-endian and unsigned,
+    so they are read by indexing and shifting instead of going through struct.
+
+    Parameters:
+        pdu: PDU in bytes that have been read from network
+        index: Position of the next field to read
+    '''
+    __slots__ = ('pdu', 'index')
+
+    def __init__(self, pdu: bytes, index: int=PDU_HEADER_LENGTH) -> None:
+        self.pdu: bytes = pdu
+        self.index: int = index
+
+    def u8(self) -> int:
+        value: int = self.pdu[self.index]
+        self.index += 1
+        return value
+
+    def octets(self, count: int) -> bytes:
+        index: int = self.index
+        self.index = index + count
+        return self.pdu[index:index+count]
+
+    def c_octet_string(self) -> str:
+        index: int = self.index
+        str_end: int = self.pdu.index(NULL, index)
+        self.index = str_end + 1
+        return self.pdu[index:str_end].decode('ascii')
 
 
 class Base(ABC):
+    # Subclasses define slots, see `add_slots`
+    __slots__ = ()
+
     def __post_init__(self):
         # Intercept the __post_init__ calls so they aren't relayed to `object`
         pass
 
+    def as_dict(self) -> Dict[str, Any]:
+        '''
+        Returns a dictionary of dataclass fields (a shallow copy, unlike dataclasses.asdict).
+        '''
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
 
 @dataclass
 class Trackable(Base):
@@ -34,6 +166,8 @@ class Trackable(Base):
         log_id: A unique identifier of this request
         extra_data: A custom string associated with this request.
     '''
+    # Slots are defined in concrete subclasses; multiple bases can't all have them
+    __slots__ = ()
     log_id: str = ''
     extra_data: str = ''
 
@@ -52,6 +186,8 @@ class SmppMessage(Base):
         sequence_num: SMPP sequence number (for requests, generated before sending)
         command_status: SMPP response status (only relevant for responses)
     '''
+    # Slots are defined in concrete subclasses; multiple bases can't all have them
+    __slots__ = ()
     sequence_num: int = 0
     command_status: SmppCommandStatus = SmppCommandStatus.ESME_ROK
 
@@ -69,7 +205,18 @@ class SmppMessage(Base):
         '''
         Returns message PDU header (packed to binary data)
         '''
-        return pack('!IIII', pdu_len, self.smpp_command, self.command_status, self.sequence_num)
+        return _HEADER.pack(pdu_len, self.smpp_command, self.command_status, self.sequence_num)
+
+    def _build_pdu(self, body_segments: Sequence[bytes]) -> bytes:
+        '''
+        Returns PDU with given body, built in a single buffer together with the header.
+        '''
+        pdu_length: int = PDU_HEADER_LENGTH + sum(map(len, body_segments))
+        buf: bytearray = bytearray(pdu_length)
+        _HEADER.pack_into(buf, 0, pdu_length, self.smpp_command, self.command_status,
+                          self.sequence_num)
+        _pack_segments(buf, PDU_HEADER_LENGTH, body_segments)
+        return bytes(buf)
 
     @staticmethod
     def parse_header(header_data: bytes) -> PduHeader:
@@ -81,14 +228,15 @@ class SmppMessage(Base):
         '''
         # First 16 bytes always contain:
         # PDU length, command ID, status, and sequence number, 4 bytes each
-        pdu_length: int = unpack_from('!I', header_data)[0]
-        command_id: int = unpack_from('!I', header_data, 4)[0]
-        command_status_id: int = unpack_from('!I', header_data, 8)[0]
-        sequence_num: int = unpack_from('!I', header_data, 12)[0]
+        pdu_length: int
+        command_id: int
+        command_status_id: int
+        sequence_num: int
+        pdu_length, command_id, command_status_id, sequence_num = _HEADER.unpack_from(header_data)
         return PduHeader(
             pdu_length=pdu_length,
-            smpp_command=SmppCommand(command_id),
-            command_status=SmppCommandStatus(command_status_id),
+            smpp_command=_COMMANDS[command_id],
+            command_status=_COMMAND_STATUSES[command_status_id],
             sequence_num=sequence_num
         )
 
@@ -96,8 +244,10 @@ class SmppMessage(Base):
         '''
         Returns message representation as SMPP PDU (encoded to binary data)
         '''
-        # Many messages have empty body, so this is a default
-        return self.pack_header(PDU_HEADER_LENGTH)
+        # Many messages have empty body, so this is a default.
+        # Header is packed directly, since keepalives (enquire_link) are sent often.
+        return _HEADER.pack(PDU_HEADER_LENGTH, self.smpp_command, self.command_status,
+                            self.sequence_num)
 
     @classmethod
     def from_pdu(cls, pdu: bytes, header: PduHeader, default_encoding: str='',
@@ -128,6 +278,7 @@ class SmppMessage(Base):
         return cls(json_object['sequence_num'], SmppCommandStatus(json_object['command_status']))
 
 
+@add_slots('_default_encoding', '_custom_codecs')
 @dataclass
 class SubmitSm(Trackable, SmppMessage):
     '''
@@ -219,6 +370,30 @@ class SubmitSm(Trackable, SmppMessage):
         self._default_encoding: str = DEFAULT_ENCODING
         self._custom_codecs: Optional[Dict[str, CodecInfo]] = None
 
+    @classmethod
+    def _from_trusted(cls, **kwargs: Any) -> SubmitSm:
+        '''
+        Creates message without running parameter validation in __post_init__.
+        Only meant for values produced by PDU parser, which are known to have correct types.
+        Fields not provided in kwargs get their default values.
+        '''
+        cached: Optional[Tuple[Dict[str, Any], FrozenSet[str]]] = _TRUSTED_DEFAULTS.get(cls)
+        if cached is None:
+            defaults: Dict[str, Any] = {field.name: field.default for field in fields(cls)
+                                        if field.default is not MISSING}
+            defaults['_default_encoding'] = DEFAULT_ENCODING
+            defaults['_custom_codecs'] = None
+            cached = _TRUSTED_DEFAULTS[cls] = (defaults, frozenset(defaults))
+        defaults, names = cached
+        # Unknown names would otherwise be silently dropped
+        assert kwargs.keys() <= names, f'Unknown parameters: {sorted(kwargs.keys() - names)}'
+        message: SubmitSm = cls.__new__(cls)
+        name: str
+        value: Any
+        for name, value in defaults.items():
+            setattr(message, name, kwargs.get(name, value))
+        return message
+
     @property
     def smpp_command(self) -> SmppCommand:
         return SmppCommand.SUBMIT_SM
@@ -235,35 +410,34 @@ class SubmitSm(Trackable, SmppMessage):
             return ''
         if isinstance(time_object, datetime):
             # datetime is converted to absolute validity
-            tenth_second: str = str(time_object.microsecond // 100000)
             offset: Optional[timedelta] = (time_object.tzinfo.utcoffset(time_object)
                                            if time_object.tzinfo else None)
-            offset_str: str
+            quarter_hours: int
             prefix: str
             if not offset:
-                offset_str = '00'
+                quarter_hours = 0
                 prefix = '+'
             else:
                 # Unit is quarter-hour (15 minutes)
-                offset_str: str = f'{int(floor(offset.seconds / (60 * 15))):02d}'
-                prefix: str = '-' if offset.days < 0 else '+'
-            return time_object.strftime('%y%m%d%H%M%S') + tenth_second + offset_str + prefix
+                quarter_hours = offset.seconds // 900
+                prefix = '-' if offset.days < 0 else '+'
+            # A single format operation is much cheaper than strftime, which goes through
+            # the locale machinery
+            return '%02d%02d%02d%02d%02d%02d%d%02d%s' % (
+                time_object.year % 100, time_object.month, time_object.day,
+                time_object.hour, time_object.minute, time_object.second,
+                time_object.microsecond // 100000, quarter_hours, prefix,
+            )
         if isinstance(time_object, timedelta):
             # timedelta is converted to relative validity
             if time_object > timedelta(weeks=63):
                 raise ValueError('Maximum message validity is 63 weeks')
-            two_digit_format: str = '{:02d}'
             total_days: int = time_object.days
-            years: str = two_digit_format.format(total_days // 365)
-            total_days %= 365
-            months: str = two_digit_format.format(total_days // 30)
-            days: str = two_digit_format.format(total_days % 30)
             total_seconds: int = time_object.seconds
-            hours: str = two_digit_format.format(total_seconds // 3600)
-            total_seconds %= 3600
-            minutes: str = two_digit_format.format(total_seconds // 60)
-            seconds: str = two_digit_format.format(total_seconds % 60)
-            return years + months + days + hours + minutes + seconds + '000R'
+            return '%02d%02d%02d%02d%02d%02d000R' % (
+                total_days // 365, total_days % 365 // 30, total_days % 365 % 30,
+                total_seconds // 3600, total_seconds % 3600 // 60, total_seconds % 60,
+            )
         raise ValueError('Only datetime and timedelta objects can be converted to SMPP format')
 
     @staticmethod
@@ -276,13 +450,18 @@ class SubmitSm(Trackable, SmppMessage):
         '''
         if not smpp_time:
             return None
-        year: int = int(smpp_time[0:2])
-        month: int = int(smpp_time[2:4])
-        day: int = int(smpp_time[4:6])
-        hour: int = int(smpp_time[6:8])
-        minute: int = int(smpp_time[8:10])
-        second: int = int(smpp_time[10:12])
-        if smpp_time.endswith('R'):
+        # Fields are two ASCII digits each, so they are computed from byte values
+        # instead of slicing out substrings and parsing each with int()
+        digits: bytes = smpp_time.encode('ascii')
+        if len(digits) < 12 or not digits[:12].isdigit():
+            raise ValueError(f'Invalid SMPP time format: `{smpp_time}`')
+        year: int = digits[0] * 10 + digits[1] - 528 # 528 == ord('0') * 11
+        month: int = digits[2] * 10 + digits[3] - 528
+        day: int = digits[4] * 10 + digits[5] - 528
+        hour: int = digits[6] * 10 + digits[7] - 528
+        minute: int = digits[8] * 10 + digits[9] - 528
+        second: int = digits[10] * 10 + digits[11] - 528
+        if digits[-1] == 0x52: # 'R'
             # Relative validity, convert to timedelta
             # For simplicity, year = 365 days, month = 30 days
             total_days: int = year * 365 + month * 30 + day
@@ -322,25 +501,33 @@ class SubmitSm(Trackable, SmppMessage):
         Parameters:
             text: Text to be encoded.
         '''
+        codec_info: CodecInfo
         if not self.encoding:
             # Auto; first try default encoding, fallback to UCS2
+            if (not text.isascii() and self.error_handling == 'strict'
+                    and self._default_encoding in _ASCII_BASED_ENCODINGS
+                    and not (self._custom_codecs and self._default_encoding in self._custom_codecs)
+                    and max(text) > _ASCII_BASED_ENCODINGS[self._default_encoding]):
+                # Default encoding is known to fail, skip raising and catching the error
+                return self._encode_ucs2(text)
+            codec_info = find_codec_info(self._default_encoding, self._custom_codecs)
             try:
-                codec_info: CodecInfo = find_codec_info(self._default_encoding, self._custom_codecs)
-                result: bytes = codec_info.encode(text, self.error_handling)[0]
+                return codec_info.encode(text, self.error_handling)[0]
             except UnicodeEncodeError:
-                codec_info: CodecInfo = find_codec_info('ucs2', self._custom_codecs)
-                result: bytes = codec_info.encode(text, self.error_handling)[0]
-                self.encoding = 'ucs2'
-        else:
-            codec_info: CodecInfo = find_codec_info(self.encoding, self._custom_codecs)
-            result: bytes = codec_info.encode(text, self.error_handling)[0]
+                return self._encode_ucs2(text)
+        codec_info = find_codec_info(self.encoding, self._custom_codecs)
+        return codec_info.encode(text, self.error_handling)[0]
+
+    def _encode_ucs2(self, text: str) -> bytes:
+        codec_info: CodecInfo = find_codec_info('ucs2', self._custom_codecs)
+        result: bytes = codec_info.encode(text, self.error_handling)[0]
+        self.encoding = 'ucs2'
         return result
 
     def pdu(self) -> bytes:
         # If encoding is set to auto, smpp_encode will set encoding param of the message
         # to ucs2 if default encoding cannot be used
         encoded_short_message: bytes = self.smpp_encode(self.short_message or self.message_payload)
-        encoded_message_payload: bytes = b''
         if self.encoding:
             data_coding: int = SmppDataCoding[self.encoding].value
         else:
@@ -350,109 +537,135 @@ class SubmitSm(Trackable, SmppMessage):
             # short_message supports up to 254 bytes, so this does not fit,
             # but automatic moving to message_payload was deactivated
             raise ValueError(f'Message is too long ({sm_length} bytes, maximum is 254)')
+        # Encoded text is written either as short_message or as message_payload TLV value
+        text_length: int = sm_length
+        payload_header_length: int = 0
         if sm_length > 254 or self.message_payload:
-            tag: int = OptionalTag.MESSAGE_PAYLOAD.value
-            encoded_message_payload = pack('!HH', tag, sm_length) + encoded_short_message
-            encoded_short_message = b''
+            payload_header_length = 4 # Tag and length, 2 bytes each
             sm_length = 0
 
-        body: bytes = (
-            self.service_type.encode('ascii') + NULL
-            + pack('!BB', self.source.ton, self.source.npi)
-            + self.source.number.encode('ascii') + NULL
-            + pack('!BB', self.destination.ton, self.destination.npi)
-            + self.destination.number.encode('ascii') + NULL
-            + pack('!BBB', self.esm_class, self.protocol_id, self.priority_flag)
-            + self.datetime_to_smpp_time(self.schedule_delivery_time).encode('ascii') + NULL
-            + self.datetime_to_smpp_time(self.validity_period).encode('ascii') + NULL
-            + pack('!BB', self.registered_delivery, self.replace_if_present_flag)
-            + pack('!BBB', data_coding, self.sm_default_msg_id, sm_length)
-            + encoded_short_message
-            + encoded_message_payload
-            + b''.join(opt_param.tlv for opt_param in self.optional_params or [])
-            # optional params may be included in ANY ORDER within
-            # the `Optional Parameters` section of the SMPP PDU.
+        service_type: bytes = self.service_type.encode('ascii')
+        source_number: bytes = self.source.number_bytes
+        destination_number: bytes = self.destination.number_bytes
+        schedule_delivery_time: bytes = self.datetime_to_smpp_time(
+            self.schedule_delivery_time).encode('ascii')
+        validity_period: bytes = self.datetime_to_smpp_time(self.validity_period).encode('ascii')
+        # optional params may be included in ANY ORDER within
+        # the `Optional Parameters` section of the SMPP PDU.
+        tlvs: List[bytes] = [opt_param.tlv for opt_param in self.optional_params or []]
+
+        # Compute total length up front and fill a single zeroed buffer,
+        # so NULL terminators are already in place and no intermediate bytes are built.
+        pdu_length: int = (
+            PDU_HEADER_LENGTH + _SM_FIXED_BODY_LENGTH
+            + len(service_type) + len(source_number) + len(destination_number)
+            + len(schedule_delivery_time) + len(validity_period)
+            + payload_header_length + text_length + sum(map(len, tlvs))
         )
-        return self.pack_header(PDU_HEADER_LENGTH + len(body)) + body
+        buf: bytearray = bytearray(pdu_length)
+        _HEADER.pack_into(buf, 0, pdu_length, self.smpp_command, self.command_status,
+                          self.sequence_num)
+        offset: int = PDU_HEADER_LENGTH
+        end: int = offset + len(service_type)
+        buf[offset:end] = service_type
+        _BB.pack_into(buf, end + 1, self.source.ton, self.source.npi)
+        offset = end + 3
+        end = offset + len(source_number)
+        buf[offset:end] = source_number
+        _BB.pack_into(buf, end + 1, self.destination.ton, self.destination.npi)
+        offset = end + 3
+        end = offset + len(destination_number)
+        buf[offset:end] = destination_number
+        _BBB.pack_into(buf, end + 1, self.esm_class, self.protocol_id, self.priority_flag)
+        offset = end + 4
+        end = offset + len(schedule_delivery_time)
+        buf[offset:end] = schedule_delivery_time
+        offset = end + 1
+        end = offset + len(validity_period)
+        buf[offset:end] = validity_period
+        offset = end + 1
+        _BB.pack_into(buf, offset, self.registered_delivery, self.replace_if_present_flag)
+        _BBB.pack_into(buf, offset + 2, data_coding, self.sm_default_msg_id, sm_length)
+        offset += 5
+        if payload_header_length:
+            _HH.pack_into(buf, offset, _MESSAGE_PAYLOAD_TAG, text_length)
+            offset += payload_header_length
+        end = offset + text_length
+        buf[offset:end] = encoded_short_message
+        _pack_segments(buf, end, tlvs)
+        return bytes(buf)
 
     @classmethod
     def from_pdu(cls, pdu: bytes, header: PduHeader, default_encoding: str='',
                  custom_codecs: Optional[Dict[str, CodecInfo]]=None) -> SmppMessage:
-        def get_c_octet_string() -> str:
-            nonlocal index
-            str_end: int = pdu.index(NULL, index)
-            octet_string: str = pdu[index:str_end].decode('ascii')
-            index = str_end + 1
-            return octet_string
-
-        def get_octet_string(count: int) -> str:
-            nonlocal index
-            octet_string: str = pdu[index:index+count].decode('ascii')
-            if octet_string.endswith(chr(0)): # String may be null-terminated
-                octet_string = octet_string[:-1]
-            index += count
-            return octet_string
-
-        def get_integer(count: int) -> int:
-            nonlocal index
-            int_format: Dict[int, str] = {
-                1: '!B', # unsigned char
-                2: '!H', # unsigned short
-                4: '!I', # unsigned int
-            }
-            integer: int = unpack_from(int_format[count], pdu, index)[0]
-            index += count
-            return integer
-
-        index: int = PDU_HEADER_LENGTH # Only body is parsed here, header is pre-parsed
-        service_type: str = get_c_octet_string()
-        source_ton: TON = TON(get_integer(1))
-        source_npi: NPI = NPI(get_integer(1))
-        source: PhoneNumber = PhoneNumber(get_c_octet_string(), source_ton, source_npi)
-        dest_ton: TON = TON(get_integer(1))
-        dest_npi: NPI = NPI(get_integer(1))
-        destination: PhoneNumber = PhoneNumber(get_c_octet_string(), dest_ton, dest_npi)
-        esm_class: int = get_integer(1)
-        protocol_id: int = get_integer(1)
-        priority_flag: int = get_integer(1)
-        schedule_delivery_time: str = get_c_octet_string()
-        validity_period: str = get_c_octet_string()
-        registered_delivery: int = get_integer(1)
-        replace_if_present_flag: int = get_integer(1)
-        data_coding: int = get_integer(1)
+        reader: _PduReader = _PduReader(pdu) # Only body is parsed here, header is pre-parsed
+        service_type: str = reader.c_octet_string()
+        source_ton: TON = _TONS[reader.u8()]
+        source_npi: NPI = _NPIS[reader.u8()]
+        source: PhoneNumber = PhoneNumber(reader.c_octet_string(), source_ton, source_npi)
+        dest_ton: TON = _TONS[reader.u8()]
+        dest_npi: NPI = _NPIS[reader.u8()]
+        destination: PhoneNumber = PhoneNumber(reader.c_octet_string(), dest_ton, dest_npi)
+        esm_class: int = reader.u8()
+        protocol_id: int = reader.u8()
+        priority_flag: int = reader.u8()
+        schedule_delivery_time: str = reader.c_octet_string()
+        validity_period: str = reader.c_octet_string()
+        registered_delivery: int = reader.u8()
+        replace_if_present_flag: int = reader.u8()
+        data_coding: int = reader.u8()
         if data_coding:
             encoding: str = SmppDataCoding(data_coding).name
         else:
             encoding: str = default_encoding
         codec_info: CodecInfo = find_codec_info(encoding, custom_codecs)
-        sm_default_msg_id: int = get_integer(1)
-        sm_length: int = get_integer(1)
-        short_message: str = codec_info.decode(pdu[index:index+sm_length])[0]
-        index += sm_length
+        sm_default_msg_id: int = reader.u8()
+        sm_length: int = reader.u8()
+        short_message: str = codec_info.decode(reader.octets(sm_length))[0]
 
         message_payload: str = ''
-        # Read optional parameters, if any
+        # Read optional parameters, if any. This is the hottest loop on receive,
+        # so TLV headers are decoded inline from local variables.
         optional_params: List[OptionalParam] = []
-        while index < header.pdu_length:
-            tag: OptionalTag = OptionalTag(get_integer(2))
-            length: int = get_integer(2)
-            if tag == OptionalTag.MESSAGE_PAYLOAD:
+        append = optional_params.append
+        pos: int = reader.index
+        end: int = header.pdu_length
+        while pos < end:
+            if pos + 4 > end:
+                raise ValueError('Truncated optional parameter')
+            tag_value: int = (pdu[pos] << 8) | pdu[pos+1]
+            length: int = (pdu[pos+2] << 8) | pdu[pos+3]
+            pos += 4
+            value_end: int = pos + length
+            if value_end > end:
+                raise ValueError('Truncated optional parameter')
+            if tag_value == _MESSAGE_PAYLOAD_TAG:
                 # message_payload is a special case, it is an alternative to short_message
-                message_payload = codec_info.decode(pdu[index:index+length])[0]
-                index += length
-            elif tag.data_type == int:
-                int_value: int = get_integer(length)
-                optional_params.append(OptionalParam(tag, int_value))
+                message_payload = codec_info.decode(pdu[pos:value_end])[0]
+                pos = value_end
+                continue
+            tag: OptionalTag = _OPTIONAL_TAGS[tag_value]
+            if tag.data_type == int:
+                append(OptionalParam(tag, int.from_bytes(pdu[pos:value_end], 'big')))
             elif tag.data_type == bool:
                 # alert_on_message_delivery doesn't have an actual value (it is zero-length),
                 # but is a bool param, so we set it to True
-                optional_params.append(OptionalParam(tag, True))
+                append(OptionalParam(tag, True))
             else:
-                # Only other possible type is str
-                str_value: str = get_octet_string(length)
-                optional_params.append(OptionalParam(tag, str_value))
+                # Only other possible type is str, which may be null-terminated
+                str_end: int = value_end - 1 if length and pdu[value_end-1] == 0 else value_end
+                append(OptionalParam(tag, pdu[pos:str_end].decode('ascii')))
+            pos = value_end
 
-        return cls(
+        if not short_message and not message_payload:
+            raise ValueError('Either short_message or message_payload must be specified')
+        if short_message and message_payload:
+            raise ValueError('Specifying both short_message and message_payload is not allowed')
+
+        # Values parsed from PDU already have correct types, so validation is skipped.
+        # This also means that service_type is not checked against its maximum length of 5,
+        # so a longer value sent by SMSC is accepted as is.
+        return cls._from_trusted(
             sequence_num=header.sequence_num,
             short_message=short_message,
             source=source,
@@ -525,6 +738,110 @@ class SubmitSm(Trackable, SmppMessage):
         )
 
 
+class SubmitSmBatch:
+    '''
+    Columnar storage for many submit_sm messages which differ only in text, destination
+    and tracking data. All other parameters are taken from the template message.
+    Rows don't carry a SubmitSm instance with its full set of parameters, and sequence
+    numbers are kept as plain integers in an array. Texts and destinations are still
+    stored as separate objects per row.
+
+    Parameters:
+        template: A message which provides shared parameters. Its text is not used.
+    '''
+    __slots__ = ('template', 'short_messages', 'destinations', 'sequence_nums',
+                 'log_ids', 'extra_data')
+
+    def __init__(self, template: SubmitSm) -> None:
+        check_param(template, 'template', SubmitSm)
+        self.template: SubmitSm = template
+        self.short_messages: List[str] = []
+        self.destinations: List[PhoneNumber] = []
+        self.sequence_nums: array = array('L')
+        self.log_ids: List[str] = []
+        self.extra_data: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.short_messages)
+
+    def append(self, short_message: str, destination: PhoneNumber, log_id: str='',
+               extra_data: str='', sequence_num: int=0) -> None:
+        '''
+        Adds a message to the batch.
+
+        Parameters:
+            short_message: Message text.
+            destination: The phone number/identifier of the message recipient.
+            log_id: A unique identifier of this request.
+            extra_data: A custom string associated with this request.
+            sequence_num: SMPP sequence number, if PDUs are built directly by `pdus`.
+        '''
+        check_param(short_message, 'short_message', str)
+        if not short_message:
+            raise ValueError('short_message must be specified')
+        check_param(destination, 'destination', PhoneNumber)
+        check_param(log_id, 'log_id', str)
+        check_param(extra_data, 'extra_data', str)
+        check_param(sequence_num, 'sequence_num', int)
+        # Checked here, so that a failing array append can't leave columns of unequal length
+        if not 0 <= sequence_num <= MAX_SEQUENCE_NUMBER:
+            raise ValueError(f'The sequence_num: {sequence_num} is outside of limits '
+                             f'0-{MAX_SEQUENCE_NUMBER}.')
+        self.short_messages.append(short_message)
+        self.destinations.append(destination)
+        self.sequence_nums.append(sequence_num)
+        self.log_ids.append(log_id)
+        self.extra_data.append(extra_data)
+
+    def messages(self) -> Iterator[SubmitSm]:
+        '''
+        Yields a SubmitSm instance for each row, e.g. for enqueueing to the broker.
+        '''
+        shared: Dict[str, Any] = self._shared_params()
+        optional_params: Optional[List[OptionalParam]] = shared['optional_params']
+        from_trusted = type(self.template)._from_trusted
+        for short_message, destination, sequence_num, log_id, extra_data in zip(
+                self.short_messages, self.destinations, self.sequence_nums,
+                self.log_ids, self.extra_data):
+            # Rows and template were validated already
+            shared.update(short_message=short_message, destination=destination,
+                          sequence_num=sequence_num, log_id=log_id, extra_data=extra_data)
+            if optional_params is not None:
+                # Each message gets its own list, so changing one doesn't affect the others
+                shared['optional_params'] = list(optional_params)
+            yield from_trusted(**shared)
+
+    def pdus(self, default_encoding: str=DEFAULT_ENCODING,
+             custom_codecs: Optional[Dict[str, CodecInfo]]=None) -> Iterator[bytes]:
+        '''
+        Yields a submit_sm PDU for each row, using stored sequence numbers.
+
+        Parameters:
+            default_encoding: SMSC default encoding.
+            custom_codecs: User-provided codecs, if any.
+        '''
+        # A single scratch message is filled with each row in turn,
+        # so PDUs are built by the same code as for separate messages
+        scratch: SubmitSm = type(self.template)._from_trusted(**self._shared_params())
+        scratch.set_encoding_info(default_encoding, custom_codecs)
+        encoding: Optional[str] = scratch.encoding
+        pdu = scratch.pdu
+        for short_message, destination, sequence_num in zip(
+                self.short_messages, self.destinations, self.sequence_nums):
+            scratch.short_message = short_message
+            scratch.destination = destination
+            scratch.sequence_num = sequence_num
+            scratch.encoding = encoding # Automatic encoding may have changed it
+            yield pdu()
+
+    def _shared_params(self) -> Dict[str, Any]:
+        params: Dict[str, Any] = self.template.as_dict()
+        # Text is provided by rows, always as short_message
+        params['message_payload'] = ''
+        return params
+
+
+@add_slots()
 @dataclass
 class SubmitSmResp(Trackable, SmppMessage):
     '''
@@ -544,8 +861,7 @@ class SubmitSmResp(Trackable, SmppMessage):
         return SmppCommand.SUBMIT_SM_RESP
 
     def pdu(self) -> bytes:
-        body: bytes = self.message_id.encode('ascii') + NULL
-        return self.pack_header(PDU_HEADER_LENGTH + len(body)) + body
+        return self._build_pdu((self.message_id.encode('ascii'), NULL))
 
     @classmethod
     def from_pdu(cls, pdu: bytes, header: PduHeader, default_encoding: str='',
@@ -568,6 +884,7 @@ class SubmitSmResp(Trackable, SmppMessage):
         )
 
 
+@add_slots()
 @dataclass
 class DeliverSm(SubmitSm):
     '''
@@ -584,56 +901,58 @@ class DeliverSm(SubmitSm):
         # Only middle 4 bits are relevant: 0 = incoming SMS, 1 = delivery receipt
         return (self.esm_class & 0b00111100) >> 2 == 1
 
-    def parse_receipt(self) -> Dict[str, Any]:
+    def parse_receipt(self, parse_text: bool=True) -> Dict[str, Any]:
         '''
         Parses short_message text and returns a dictionary with receipt data.
+
+        Parameters:
+            parse_text: If False and receipted_message_id optional param is present,
+                        only its value is returned (as `id`), without parsing the text.
         '''
         if not self.is_receipt():
             return {}
-
-        def get_receipt_param() -> Tuple[Optional[str], Optional[str]]:
-            nonlocal index
-            str_end: int = self.short_message.find(':', index)
-            if str_end == -1:
-                return None, None
-            param: str = self.short_message[index:str_end].lower()
-            index = str_end + 1
-            str_end = self.short_message.find(' ', index)
-            if str_end == -1 or param == 'text': # Text must be last
-                str_end = len(self.short_message)
-            value: str = self.short_message[index:str_end]
-            index = str_end + 1
-            return param, value
-
+        receipted_message_id: Optional[str]
+        if not parse_text:
+            receipted_message_id = self._receipted_message_id()
+            if receipted_message_id:
+                return {'id': receipted_message_id}
+
+        # Receipt is a sequence of `param:value` pairs separated by spaces (param names
+        # may contain spaces too). Text value may contain anything, so it must be last.
         rcpt_data: Dict[str, Any] = {}
-        index: int = 0
-        rcpt_param: Optional[str]
-        rcpt_value: Optional[str]
+        rest: str = self.short_message
+        rcpt_param: str
+        rcpt_value: str
+        separator: str
         while True:
-            rcpt_param, rcpt_value = get_receipt_param()
-            if rcpt_param is None or rcpt_value is None:
+            rcpt_param, separator, rest = rest.partition(':')
+            if not separator:
                 break
-            if rcpt_param in ('sub', 'dlvrd'):
-                rcpt_data[rcpt_param] = int(rcpt_value)
-            elif rcpt_param in ('submit date', 'done date'):
-                rcpt_data[rcpt_param] = datetime.strptime(rcpt_value, '%y%m%d%H%M')
-            elif rcpt_param in ('id', 'stat', 'err', 'text'):
-                rcpt_data[rcpt_param] = rcpt_value
+            rcpt_param = rcpt_param.lower()
+            if rcpt_param == 'text':
+                rcpt_value, rest = rest, ''
             else:
-                rcpt_data[rcpt_param] = rcpt_value
+                rcpt_value, _, rest = rest.partition(' ')
+            converter: Optional[Callable[[str], Any]] = _RECEIPT_CONVERTERS.get(rcpt_param)
+            # Params without a converter (id, stat, err, text and unknown ones) are kept as text
+            rcpt_data[rcpt_param] = converter(rcpt_value) if converter else rcpt_value
 
         smsc_message_id: Optional[str] = rcpt_data.get('id') # Get message ID from report data
-        if not smsc_message_id and self.optional_params:
+        if not smsc_message_id:
             # Message ID not found, check if receipted_message_id param exists
-            id_param: Optional[OptionalParam] = next((
-                param for param in self.optional_params
-                if param.tag == OptionalTag.RECEIPTED_MESSAGE_ID
-            ), None)
-            if id_param:
-                rcpt_data['id'] = id_param.value
+            receipted_message_id = self._receipted_message_id()
+            if receipted_message_id is not None:
+                rcpt_data['id'] = receipted_message_id
 
         return rcpt_data
 
+    def _receipted_message_id(self) -> Optional[str]:
+        opt_param: OptionalParam
+        for opt_param in self.optional_params or ():
+            if opt_param.tag is OptionalTag.RECEIPTED_MESSAGE_ID:
+                return cast(str, opt_param.value) # Always str for this tag
+        return None
+
     @staticmethod
     def encode_receipt(rcpt_data: Dict[str, Any]) -> str:
         '''
@@ -648,18 +967,24 @@ class DeliverSm(SubmitSm):
         dlvrd: int = rcpt_data.get('dlvrd', 0) # Number of short messages delivered.
         # The time and date at which the message was submitted.
         submit_date: Optional[datetime] = rcpt_data.get('submit date')
-        submit_date_str: str = submit_date.strftime('%y%m%d%H%M') if submit_date else ''
+        submit_date_str: str = _receipt_date_to_str(submit_date) if submit_date else ''
         # The time and date at which the message reached its final state.
         done_date: Optional[datetime] = rcpt_data.get('done date')
-        done_date_str: str = done_date.strftime('%y%m%d%H%M') if done_date else ''
+        done_date_str: str = _receipt_date_to_str(done_date) if done_date else ''
         stat: str = rcpt_data.get('stat', '') # The final status of the message.
         err: str = rcpt_data.get('err', '') # Network specific error code or an SMSC error code.
         text: str = rcpt_data.get('text', '') # The first 20 characters of the short message.
-        return (f'id:{msg_id} sub:{sub:03d} dlvrd:{dlvrd:03d}'
-                f' submit date:{submit_date_str} done date:{done_date_str}'
-                f' stat:{stat} err:{err} Text:{text:20}')
+        # Joining strings avoids building an f-string from many pieces. Values are converted
+        # the same way as the f-string did, so non-str values (e.g. int error codes) are
+        # accepted and non-int counts are rejected, as before.
+        return ''.join((
+            'id:', str(msg_id), ' sub:', format(sub, '03d'), ' dlvrd:', format(dlvrd, '03d'),
+            ' submit date:', submit_date_str, ' done date:', done_date_str,
+            ' stat:', str(stat), ' err:', str(err), ' Text:', format(text, '20'),
+        ))
 
 
+@add_slots()
 @dataclass
 class DeliverSmResp(SubmitSmResp):
     '''
@@ -670,6 +995,7 @@ class DeliverSmResp(SubmitSmResp):
         return SmppCommand.DELIVER_SM_RESP
 
 
+@add_slots()
 @dataclass
 class GenericNack(Trackable, SmppMessage):
     '''
@@ -680,6 +1006,7 @@ class GenericNack(Trackable, SmppMessage):
         return SmppCommand.GENERIC_NACK
 
 
+@add_slots()
 @dataclass
 class BindTransceiver(SmppMessage):
     '''
@@ -717,40 +1044,26 @@ class BindTransceiver(SmppMessage):
         return SmppCommand.BIND_TRANSCEIVER
 
     def pdu(self) -> bytes:
-        body: bytes = (
-            self.system_id.encode('ascii') + NULL
-            + self.password.encode('ascii') + NULL
-            + self.system_type.encode('ascii') + NULL
-            + pack('!BBB', self.interface_version, self.addr_ton, self.addr_npi)
-            + self.address_range.encode('ascii') + NULL
-        )
-        return self.pack_header(PDU_HEADER_LENGTH + len(body)) + body
+        return self._build_pdu((
+            self.system_id.encode('ascii'), NULL,
+            self.password.encode('ascii'), NULL,
+            self.system_type.encode('ascii'), NULL,
+            _BBB.pack(self.interface_version, self.addr_ton, self.addr_npi),
+            self.address_range.encode('ascii'), NULL,
+        ))
 
     @classmethod
     def from_pdu(cls, pdu: bytes, header: PduHeader, default_encoding: str='',
                  custom_codecs: Optional[Dict[str, CodecInfo]]=None) -> SmppMessage:
         # pylint: disable=unused-argument
-        def get_c_octet_string() -> str:
-            nonlocal index
-            str_end: int = pdu.index(NULL, index)
-            octet_string: str = pdu[index:str_end].decode('ascii')
-            index = str_end + 1
-            return octet_string
-
-        def get_char() -> int:
-            nonlocal index
-            integer: int = unpack_from('!B', pdu, index)[0]
-            index += 1
-            return integer
-
-        index: int = PDU_HEADER_LENGTH # Only body is parsed here, header is pre-parsed
-        system_id: str = get_c_octet_string()
-        password: str = get_c_octet_string()
-        system_type: str = get_c_octet_string()
-        interface_version: int = get_char()
-        addr_ton: TON = TON(get_char())
-        addr_npi: NPI = NPI(get_char())
-        address_range: str = get_c_octet_string()
+        reader: _PduReader = _PduReader(pdu) # Only body is parsed here, header is pre-parsed
+        system_id: str = reader.c_octet_string()
+        password: str = reader.c_octet_string()
+        system_type: str = reader.c_octet_string()
+        interface_version: int = reader.u8()
+        addr_ton: TON = _TONS[reader.u8()]
+        addr_npi: NPI = _NPIS[reader.u8()]
+        address_range: str = reader.c_octet_string()
 
         return cls(
             sequence_num=header.sequence_num,
@@ -777,6 +1090,7 @@ class BindTransceiver(SmppMessage):
         )
 
 
+@add_slots()
 @dataclass
 class BindTransceiverResp(SmppMessage):
     '''
@@ -798,10 +1112,12 @@ class BindTransceiverResp(SmppMessage):
         return SmppCommand.BIND_TRANSCEIVER_RESP
 
     def pdu(self) -> bytes:
-        body: bytes = self.system_id.encode('ascii') + NULL
+        parts: List[bytes] = [self.system_id.encode('ascii'), NULL]
         if self.sc_interface_version is not None:
-            body += OptionalParam(OptionalTag.SC_INTERFACE_VERSION, self.sc_interface_version).tlv
-        return self.pack_header(PDU_HEADER_LENGTH + len(body)) + body
+            parts.append(
+                OptionalParam(OptionalTag.SC_INTERFACE_VERSION, self.sc_interface_version).tlv
+            )
+        return self._build_pdu(parts)
 
     @classmethod
     def from_pdu(cls, pdu: bytes, header: PduHeader, default_encoding: str='',
@@ -815,7 +1131,7 @@ class BindTransceiverResp(SmppMessage):
             # Optional param sc_interface_version. It must have a total of 5 bytes in length.
             index += 4
             if index + 1 == header.pdu_length:
-                sc_interface_version = unpack_from('!B', pdu, index)[0]
+                sc_interface_version = pdu[index]
         return cls(
             sequence_num=header.sequence_num,
             command_status=header.command_status,
@@ -833,6 +1149,7 @@ class BindTransceiverResp(SmppMessage):
         )
 
 
+@add_slots()
 @dataclass
 class BindTransmitter(BindTransceiver):
     '''
@@ -843,6 +1160,7 @@ class BindTransmitter(BindTransceiver):
         return SmppCommand.BIND_TRANSMITTER
 
 
+@add_slots()
 @dataclass
 class BindTransmitterResp(BindTransceiverResp):
     '''
@@ -853,6 +1171,7 @@ class BindTransmitterResp(BindTransceiverResp):
         return SmppCommand.BIND_TRANSMITTER_RESP
 
 
+@add_slots()
 @dataclass
 class BindReceiver(BindTransceiver):
     '''
@@ -863,6 +1182,7 @@ class BindReceiver(BindTransceiver):
         return SmppCommand.BIND_RECEIVER
 
 
+@add_slots()
 @dataclass
 class BindReceiverResp(BindTransceiverResp):
     '''
@@ -873,6 +1193,7 @@ class BindReceiverResp(BindTransceiverResp):
         return SmppCommand.BIND_RECEIVER_RESP
 
 
+@add_slots()
 @dataclass
 class EnquireLink(SmppMessage):
     '''
@@ -883,6 +1204,7 @@ class EnquireLink(SmppMessage):
         return SmppCommand.ENQUIRE_LINK
 
 
+@add_slots()
 @dataclass
 class EnquireLinkResp(SmppMessage):
     '''
@@ -893,6 +1215,7 @@ class EnquireLinkResp(SmppMessage):
         return SmppCommand.ENQUIRE_LINK_RESP
 
 
+@add_slots()
 @dataclass
 class Unbind(SmppMessage):
     '''
@@ -903,6 +1226,7 @@ class Unbind(SmppMessage):
         return SmppCommand.UNBIND
 
 
+@add_slots()
 @dataclass
 class UnbindResp(SmppMessage):
     '''
@@ -930,3 +1254,8 @@ MESSAGE_TYPE_MAP: Dict[SmppCommand, Type[SmppMessage]] = {
     SmppCommand.UNBIND: Unbind,
     SmppCommand.UNBIND_RESP: UnbindResp,
 }
+# Bound parsers of message classes, for dispatching received PDUs with a single lookup.
+# Built once from MESSAGE_TYPE_MAP above, which lists every message type ESME handles.
+FROM_PDU_MAP: Dict[SmppCommand, Callable[..., SmppMessage]] = {
+    command: message_class.from_pdu for command, message_class in MESSAGE_TYPE_MAP.items()
+}
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from struct import pack
+from struct import Struct
 from enum import IntEnum, auto
-from typing import Dict, Type, Union
-from .utils import check_param
+from typing import Dict, FrozenSet, Optional, Tuple, Type, Union
+from .utils import add_slots, check_param
 
 
 class SmppCommand(IntEnum):
@@ -322,6 +322,18 @@ class SmppDataCoding(IntEnum):
         return 'KS C 5601' # self.value == 0b00001110
 
 
+# Values of optional parameter tags by data type; see OptionalTag.data_type.
+# They can't be defined in enum body, because they would become members.
+_STR_TAGS: FrozenSet[int] = frozenset((0x001D, 0x001E, 0x0202, 0x0203, 0x0303,
+                                       0x0381, 0x0423, 0x0424, 0x0501, 0x1383))
+_INT_TAGS: FrozenSet[int] = frozenset((
+    0x0005, 0x0006, 0x0007, 0x0008, 0x000D, 0x000E, 0x000F, 0x0010, 0x0017,
+    0x0019, 0x0030, 0x0201, 0x0204, 0x0205, 0x020A, 0x020B, 0x020C, 0x020D,
+    0x020E, 0x020F, 0x0210, 0x0302, 0x0304, 0x0420, 0x0421, 0x0422, 0x0425,
+    0x0426, 0x0427, 0x1201, 0x1203, 0x1204, 0x1380,
+))
+
+
 class OptionalTag(IntEnum):
     '''
     Represents SMPP optional tag.
@@ -463,13 +475,9 @@ class OptionalTag(IntEnum):
 
     @property
     def data_type(self) -> Type:
-        if self.value in (0x001D, 0x001E, 0x0202, 0x0203, 0x0303,
-                          0x0381, 0x0423, 0x0424, 0x0501, 0x1383):
+        if self.value in _STR_TAGS:
             return str
-        if self.value in (0x0005, 0x0006, 0x0007, 0x0008, 0x000D, 0x000E, 0x000F, 0x0010, 0x0017,
-                          0x0019, 0x0030, 0x0201, 0x0204, 0x0205, 0x020A, 0x020B, 0x020C, 0x020D,
-                          0x020E, 0x020F, 0x0210, 0x0302, 0x0304, 0x0420, 0x0421, 0x0422, 0x0425,
-                          0x0426, 0x0427, 0x1201, 0x1203, 0x1204, 0x1380):
+        if self.value in _INT_TAGS:
             return int
         if self.value == 0x130C:
             # ALERT_ON_MESSAGE_DELIVERY doesn't actually have any value.
@@ -477,6 +485,16 @@ class OptionalTag(IntEnum):
             return bool
 
 
+# Tag and length header of an optional parameter, followed by unsigned int value of given size
+_TLV_HEADER: Struct = Struct('!HH')
+_TLV_INT: Dict[int, Struct] = {
+    1: Struct('!HHB'), # unsigned char
+    2: Struct('!HHH'), # unsigned short
+    4: Struct('!HHI'), # unsigned int
+}
+
+
+@add_slots('_tlv_cache')
 @dataclass
 class OptionalParam():
     '''
@@ -520,6 +538,9 @@ class OptionalParam():
             # It can't be built here, because encoding info from both ESME and SubmitSm is needed
             raise ValueError('Creation OptionalParam with MESSAGE_PAYLOAD tag is not allowed. '
                              'It is handled automatically if needed.')
+        # TLV is packed on first use (never for parsed params), together with the tag and value
+        # it was packed from, so a reassigned tag or value is not sent stale
+        self._tlv_cache: Optional[Tuple[OptionalTag, Union[int, str, bool], bytes]] = None
 
     @property
     def length(self) -> int:
@@ -587,26 +608,26 @@ class OptionalParam():
         '''
         Returns the bytes representation of an optional SMPP parameter.
         '''
+        cache: Optional[Tuple[OptionalTag, Union[int, str, bool], bytes]] = self._tlv_cache
+        if cache is None or cache[0] is not self.tag or cache[1] is not self.value:
+            cache = self._tlv_cache = (self.tag, self.value, self._pack_tlv())
+        return cache[2]
 
+    def _pack_tlv(self) -> bytes:
         length: int = self.length
         if self.tag.data_type == int:
-            int_format: Dict[int, str] = {
-                1: '!HHB', # unsigned char
-                2: '!HHH', # unsigned short
-                4: '!HHI', # unsigned int
-            }
-            return pack(int_format[length], self.tag.value, length, self.value)
+            return _TLV_INT[length].pack(self.tag.value, length, self.value)
         if self.tag.data_type == str:
             assert isinstance(self.value, str) # For linters
             val: bytes = self.value.encode('ascii') # Octet String
             if self.tag in (OptionalTag.ADDITIONAL_STATUS_INFO_TEXT,
                             OptionalTag.RECEIPTED_MESSAGE_ID):
-                val += chr(0).encode('ascii') # C Octet String, terminate with NULL
-            return pack('!HH', self.tag, length) + val
+                val += b'\x00' # C Octet String, terminate with NULL
+            return _TLV_HEADER.pack(self.tag, length) + val
         # Only remaining option is alert_on_message_delivery; see section 5.3.2.41 of SMPP document
         if self.value:
             # TLV has no value field
-            return pack('!HH', self.tag, self.length)
+            return _TLV_HEADER.pack(self.tag, length)
         return b''
 
 
@@ -643,6 +664,7 @@ class NPI(IntEnum):
     WAP_CLIENT_ID = 0b00010010
 
 
+@add_slots('_number_cache')
 @dataclass
 class PhoneNumber():
     '''
@@ -656,8 +678,23 @@ class PhoneNumber():
         check_param(self.number, 'number', str, maxlen=20)
         check_param(self.ton, 'ton', TON)
         check_param(self.npi, 'npi', NPI)
+        # Encoded number is kept together with the string it was encoded from,
+        # so a reassigned number is not sent stale
+        self._number_cache: Optional[Tuple[str, bytes]] = None
+
+    @property
+    def number_bytes(self) -> bytes:
+        '''
+        Returns the number encoded as ASCII, as it is written to PDU.
+        The result is cached, since the same numbers are usually used for many messages.
+        '''
+        cache: Optional[Tuple[str, bytes]] = self._number_cache
+        if cache is None or cache[0] is not self.number:
+            cache = self._number_cache = (self.number, self.number.encode('ascii'))
+        return cache[1]
 
 
+@add_slots()
 @dataclass
 class PduHeader():
     '''
@@ -1,5 +1,9 @@
+from dataclasses import fields
 from datetime import datetime, timedelta, tzinfo
-from typing import Any, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Type, TypeVar, Union
+
+
+T = TypeVar('T') # For generic type hints
 
 
 def check_param(param: Any, param_name: str, param_type: Union[Type, Tuple[Type]],
@@ -20,6 +24,51 @@ def check_param(param: Any, param_name: str, param_type: Union[Type, Tuple[Type]
                          f'and the length of provided value is `{len(param)}`.')
 
 
+def add_slots(*extra_slots: str) -> Callable[[Type[T]], Type[T]]:
+    '''
+    Class decorator that recreates a dataclass with `__slots__` for all its fields,
+    so that instances don't carry a `__dict__`. This is an equivalent of
+    `dataclass(slots=True)`, which is only available in Python 3.10+.
+    It must be applied on top of the `@dataclass` decorator.
+
+    Parameters:
+        extra_slots: Names of non-field attributes that are set on instances.
+    '''
+    def wrap(cls: Type[T]) -> Type[T]:
+        inherited_slots: Set[str] = set()
+        for base in cls.__mro__[1:]:
+            inherited_slots.update(base.__dict__.get('__slots__', ()))
+        slot_names: Tuple[str, ...] = tuple(
+            name for name in dict.fromkeys([field.name for field in fields(cls)]
+                                           + list(extra_slots))
+            if name not in inherited_slots
+        )
+        cls_dict: Dict[str, Any] = dict(cls.__dict__)
+        cls_dict['__slots__'] = slot_names
+        for name in slot_names:
+            # Remove default values, they would conflict with slot descriptors.
+            # Dataclass __init__ keeps its own copy of defaults.
+            cls_dict.pop(name, None)
+        cls_dict.pop('__dict__', None)
+        cls_dict.pop('__weakref__', None)
+        new_cls: Type[T] = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        # Methods using zero-argument super() hold a reference to the original class,
+        # which has to be replaced with the recreated one
+        for value in cls_dict.values():
+            if isinstance(value, (classmethod, staticmethod)):
+                value = value.__func__
+            elif isinstance(value, property):
+                value = value.fget
+            for cell in getattr(value, '__closure__', None) or ():
+                try:
+                    if cell.cell_contents is cls:
+                        cell.cell_contents = new_cls
+                except ValueError: # Empty cell
+                    pass
+        return new_cls
+    return wrap
+
+
 class FixedOffset(tzinfo):
     """Fixed offset from UTC."""
 
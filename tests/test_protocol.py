@@ -1,13 +1,15 @@
-from datetime import datetime
+import copy
+import pickle
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Tuple
 import pytest
 from aiosmpplib.protocol import DEFAULT_ENCODING, SMPP_VERSION_3_4
 from aiosmpplib import json_decode, json_encode
 from aiosmpplib import PhoneNumber, TON, NPI, OptionalParam, OptionalTag
-from aiosmpplib import (SubmitSm, SubmitSmResp, DeliverSm, DeliverSmResp, Unbind, UnbindResp,
-                        BindTransceiver, BindTransceiverResp, BindReceiver, BindReceiverResp,
-                        BindTransmitter, BindTransmitterResp, EnquireLink, EnquireLinkResp,
-                        SmppMessage, PduHeader, GenericNack)
+from aiosmpplib import (SubmitSm, SubmitSmBatch, SubmitSmResp, DeliverSm, DeliverSmResp, Unbind,
+                        UnbindResp, BindTransceiver, BindTransceiverResp, BindReceiver,
+                        BindReceiverResp, BindTransmitter, BindTransmitterResp, EnquireLink,
+                        EnquireLinkResp, SmppMessage, PduHeader, GenericNack)
 
 
 BIND_TRANSCEIVER = BindTransceiver(
@@ -25,10 +27,10 @@ BIND_TRANSCEIVER_RESP = BindTransceiverResp(
     sc_interface_version=SMPP_VERSION_3_4,
     sequence_num=1,
 )
-BIND_TRANSMITTER = BindTransmitter(**BIND_TRANSCEIVER.__dict__)
-BIND_TRANSMITTER_RESP = BindTransmitterResp(**BIND_TRANSCEIVER_RESP.__dict__)
-BIND_RECEIVER = BindReceiver(**BIND_TRANSCEIVER.__dict__)
-BIND_RECEIVER_RESP = BindReceiverResp(**BIND_TRANSCEIVER_RESP.__dict__)
+BIND_TRANSMITTER = BindTransmitter(**BIND_TRANSCEIVER.as_dict())
+BIND_TRANSMITTER_RESP = BindTransmitterResp(**BIND_TRANSCEIVER_RESP.as_dict())
+BIND_RECEIVER = BindReceiver(**BIND_TRANSCEIVER.as_dict())
+BIND_RECEIVER_RESP = BindReceiverResp(**BIND_TRANSCEIVER_RESP.as_dict())
 SUBMIT_SM: SubmitSm = SubmitSm(
     short_message='Test message',
     source=PhoneNumber('INFO', TON.ALPHANUMERIC),
@@ -94,6 +96,41 @@ def test_json_serialization(desc: str, message: SmppMessage):
     decoded_message: SmppMessage = json_decode(json_data)
     assert message == decoded_message, desc + ' incorrectly decoded from JSON'
 
+def test_slots():
+    # Messages use slots instead of per-instance __dict__
+    for _, message in TEST_MESSAGES:
+        assert not hasattr(message, '__dict__'), message.__class__.__name__ + ' has __dict__'
+
+
+def test_submit_sm_batch():
+    batch: SubmitSmBatch = SubmitSmBatch(SUBMIT_SM_WITH_OPT_PARAMS)
+    batch.append('First message', PhoneNumber('+123135654618'), log_id='1', sequence_num=1)
+    batch.append('Second 😇', PhoneNumber('+123135654619'), log_id='2', sequence_num=2)
+    assert len(batch) == 2
+    messages: List[SubmitSm] = list(batch.messages())
+    assert [message.log_id for message in messages] == ['1', '2']
+    assert messages[1].destination == PhoneNumber('+123135654619')
+    # Batch PDUs are the same as those of separately created messages
+    expected: List[bytes] = []
+    for message in messages:
+        message.set_encoding_info(DEFAULT_ENCODING, None)
+        expected.append(message.pdu())
+    assert list(batch.pdus()) == expected
+    # Messages don't share mutable parameters
+    assert messages[0].optional_params == messages[1].optional_params
+    assert messages[0].optional_params is not messages[1].optional_params
+    assert messages[0].optional_params is not SUBMIT_SM_WITH_OPT_PARAMS.optional_params
+    with pytest.raises(ValueError):
+        batch.append('', PhoneNumber('+123135654618'))
+    # A rejected row leaves the batch unchanged
+    with pytest.raises(ValueError):
+        batch.append('Third message', PhoneNumber('+123135654618'), sequence_num=-1)
+    with pytest.raises(ValueError):
+        batch.append('Third message', PhoneNumber('+123135654618'), sequence_num=0x80000000)
+    assert len(batch) == 2
+    assert len(batch.sequence_nums) == 2
+
+
 def test_delivery_receipt():
     msg_id: str = 'FE456A00'
     # Only minute resolution supported
@@ -125,6 +162,31 @@ def test_delivery_receipt():
     assert deliver_sm_receipt.parse_receipt() == receipt
     assert DeliverSm.encode_receipt(receipt) == receipt_text
 
+    # Message ID from text takes precedence, unless text parsing is skipped
+    deliver_sm_receipt.optional_params = [
+        OptionalParam(OptionalTag.RECEIPTED_MESSAGE_ID, 'FE456A01'),
+    ]
+    assert deliver_sm_receipt.parse_receipt() == receipt
+    assert deliver_sm_receipt.parse_receipt(parse_text=False) == {'id': 'FE456A01'}
+
+    # Non-str values are formatted as text, while counts must be integers
+    assert DeliverSm.encode_receipt({'id': 123, 'err': 0}) == (
+        'id:123 sub:000 dlvrd:000 submit date: done date: stat: err:0 Text:' + ' ' * 20
+    )
+    with pytest.raises(ValueError):
+        DeliverSm.encode_receipt({'id': msg_id, 'sub': 1.5})
+
+    # Two-digit years are mapped the same way as by strptime
+    deliver_sm_receipt.short_message = (f'id:{msg_id} submit date:6901020304 '
+                                        f'done date:6812312359 stat:{stat}')
+    parsed_receipt: Dict[str, Any] = deliver_sm_receipt.parse_receipt()
+    assert parsed_receipt['submit date'] == datetime(1969, 1, 2, 3, 4)
+    assert parsed_receipt['done date'] == datetime(2068, 12, 31, 23, 59)
+    # Malformed dates are rejected
+    deliver_sm_receipt.short_message = f'id:{msg_id} submit date:2113010000 stat:{stat}'
+    with pytest.raises(ValueError):
+        deliver_sm_receipt.parse_receipt()
+
 
 class BadArg:
     pass
@@ -180,3 +242,60 @@ def test_optional_param(tag: OptionalTag):
             OptionalParam(tag, tag.data_type())
     else:
         assert OptionalParam(tag, tag.data_type()) is not None
+
+
+def test_optional_param_tlv():
+    opt_param: OptionalParam = OptionalParam(OptionalTag.SAR_MSG_REF_NUM, 1)
+    # Cached TLV is kept in a slot, not in a per-instance __dict__
+    assert not hasattr(opt_param, '__dict__')
+    assert opt_param.tlv == b'\x02\x0c\x00\x02\x00\x01'
+    # TLV follows changes of the value
+    opt_param.value = 2
+    assert opt_param.tlv == b'\x02\x0c\x00\x02\x00\x02'
+
+    # Received params are not re-packed, so a value wider than specified is still parsed
+    pdu: bytes = DELIVER_SM.pdu() + b'\x02\x0c\x00\x04\x00\x01\x11\x70'
+    pdu = len(pdu).to_bytes(4, 'big') + pdu[4:]
+    decoded_message: SmppMessage = DeliverSm.from_pdu(pdu, SmppMessage.parse_header(pdu),
+                                                      DEFAULT_ENCODING)
+    assert decoded_message.optional_params == [OptionalParam(OptionalTag.SAR_MSG_REF_NUM, 70000)]
+
+
+def test_phone_number_bytes():
+    phone_number: PhoneNumber = PhoneNumber('+123135654618')
+    assert phone_number.number_bytes == b'+123135654618'
+    # Encoded number follows changes of the number
+    phone_number.number = '+123135654619'
+    assert phone_number.number_bytes == b'+123135654619'
+
+
+def test_smpp_time():
+    assert SubmitSm.smpp_time_to_datetime('') is None
+    assert SubmitSm.smpp_time_to_datetime('000001020304000R') == timedelta(days=1, hours=2,
+                                                                           minutes=3, seconds=4)
+    # Each field must consist of two digits, signs and spaces are not accepted
+    for smpp_time in ('0000010203', '00000102030a000R', '00+001020304000R', '00 001020304000R'):
+        with pytest.raises(ValueError):
+            SubmitSm.smpp_time_to_datetime(smpp_time)
+
+
+def test_copy_after_pdu():
+    # Messages handed to hooks, correlator and broker after sending can still be copied
+    for original in (SUBMIT_SM, SUBMIT_SM_WITH_OPT_PARAMS, DELIVER_SM):
+        message: SubmitSm = copy.deepcopy(original) # Shared test messages are left untouched
+        message.set_encoding_info(DEFAULT_ENCODING, None)
+        message.pdu()
+        assert copy.deepcopy(message) == message
+        assert pickle.loads(pickle.dumps(message)) == message
+
+
+@pytest.mark.parametrize('tlv', (
+    bytes.fromhex('001d0005616263'), # String value shorter than its length
+    bytes.fromhex('00050001'), # Int value missing
+    bytes.fromhex('0005'), # Header cut off
+))
+def test_truncated_optional_param(tlv: bytes):
+    pdu: bytes = DELIVER_SM.pdu() + tlv
+    pdu = len(pdu).to_bytes(4, 'big') + pdu[4:]
+    with pytest.raises(ValueError):
+        DeliverSm.from_pdu(pdu, SmppMessage.parse_header(pdu), DEFAULT_ENCODING)